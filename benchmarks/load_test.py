@@ -0,0 +1,335 @@
+"""
+Replayable load test and regression gate for the FastAPI service.
+
+Replays recorded multi-turn conversations against /search-sales-info, each
+conversation on a fresh thread with its turns sent in order, while many
+conversations run concurrently. The server runs benchmarks.stub_app with
+the real workflow and stubbed LLM / MySQL backends at fixed latencies.
+
+Measures throughput, latency percentiles, errors and server event-loop lag,
+can save the result as a baseline, and fails when the error rate rises or
+p95 latency or requests per second regress beyond a threshold against a
+saved baseline. Runs are only compared with baselines recorded with the
+same settings. The stub server uses its own Redis database (--redis-url),
+so its audit records and metrics never mix with recorded traffic.
+
+The stub server keeps conversation state in MemorySaver by default, also
+with --workers > 1, so follow-up turns that reach another worker start from
+an empty thread and cross-worker continuity is not exercised. With
+--checkpointer redis it uses RedisSaver, whose search indexes only exist on
+database 0: point --redis-url at database 0 of a separate Redis Stack
+instance, never at the production one.
+
+Event-loop lag comes from one worker: with --workers > 1 the lag endpoint
+(including its reset) reaches a single gunicorn worker per call.
+
+Usage:
+    # Export recorded conversations from the Redis audit trail
+    python -m benchmarks.load_test export --output benchmarks/conversations.json
+
+    # Run and save a baseline
+    python -m benchmarks.load_test run --conversations benchmarks/conversations.json \\
+        --save-baseline benchmarks/baseline.json
+
+    # Regression gate
+    python -m benchmarks.load_test run --conversations benchmarks/conversations.json \\
+        --baseline benchmarks/baseline.json --max-regression 0.10
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from benchmarks.worker_scaling import wait_until_healthy
+
+# Used when no recorded conversations are available
+SAMPLE_CONVERSATIONS = [
+    ["Quantos coolers estão em serviço?"],
+    ["Quero ver um cooler", "O cooler 1010001"],
+    ["Liste os coolers movidos", "Só os do último mês", "E quantos são no total?"],
+]
+
+
+def export_conversations(output: str, limit: int, min_turns: int):
+    """Read audit records from Redis and write their user turns as conversations."""
+    from src.redis.config import redis_binary_client
+    from src.redis.db_operations import THREAD_KEY_PREFIX, get_thread_interactions
+
+    conversations = []
+    for key in redis_binary_client.scan_iter(match=f"{THREAD_KEY_PREFIX}*", count=500):
+        thread_id = key.decode().removeprefix(THREAD_KEY_PREFIX)
+        data, _ = asyncio.run(get_thread_interactions(thread_id, ["messages"]))
+        turns = [
+            msg["content"] for msg in (data or {}).get("messages", [])
+            if msg.get("type") == "HumanMessage"
+        ]
+        if len(turns) >= min_turns:
+            conversations.append(turns)
+        if len(conversations) >= limit:
+            break
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(conversations, f, ensure_ascii=False, indent=2)
+    print(f"Exported {len(conversations)} conversations to {output}")
+
+
+def load_conversations(path: str) -> list:
+    if not path:
+        return SAMPLE_CONVERSATIONS
+    with open(path, encoding="utf-8") as f:
+        conversations = [turns for turns in json.load(f) if turns]
+    if not conversations:
+        raise ValueError(f"No conversations in {path}")
+    return conversations
+
+
+def start_server(args) -> subprocess.Popen:
+    """Start benchmarks.stub_app with stubbed backends (gunicorn when --workers > 1)."""
+    env = {
+        **os.environ,
+        "STUB_MODE": "backends",
+        "STUB_LLM_LATENCY": str(args.llm_latency),
+        "STUB_DB_LATENCY": str(args.db_latency),
+        # Separate database: load-test threads must not be exported as recorded traffic
+        "REDIS_URL": args.redis_url,
+        # Set explicitly: gunicorn.conf.py would otherwise default to redis
+        "CHECKPOINTER": args.checkpointer,
+    }
+    if args.workers > 1:
+        env.update({"WEB_CONCURRENCY": str(args.workers), "BIND": f"127.0.0.1:{args.port}"})
+        command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "benchmarks.stub_app:app"]
+    else:
+        command = [sys.executable, "-m", "uvicorn", "benchmarks.stub_app:app", "--port", str(args.port)]
+
+    return subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def get_json(url: str) -> dict:
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return json.loads(response.read())
+
+
+def send_turn(base_url: str, thread_id: str, message: str) -> float:
+    """POST one conversation turn and return its latency in seconds."""
+    body = json.dumps({"message": message, "thread_id": thread_id}).encode()
+    request = urllib.request.Request(
+        f"{base_url}/search-sales-info",
+        data=body,
+        headers={"Content-Type": "application/json"},
+    )
+    start = time.perf_counter()
+    with urllib.request.urlopen(request, timeout=120) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def replay(base_url: str, conversations: list, concurrency: int, duration: float) -> dict:
+    """
+    Replay conversations with `concurrency` virtual users for `duration` seconds.
+
+    Each virtual user takes the next conversation, sends its turns in order
+    on a new thread, and repeats until the time is up.
+    """
+    next_conversation = itertools.cycle(conversations)
+    lock = threading.Lock()
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+
+    def virtual_user():
+        while time.perf_counter() < deadline:
+            with lock:
+                turns = next(next_conversation)
+            thread_id = f"loadtest-{uuid.uuid4()}"
+            for message in turns:
+                if time.perf_counter() >= deadline:
+                    return
+                try:
+                    latency = send_turn(base_url, thread_id, message)
+                except Exception as e:
+                    with lock:
+                        errors.append(f"{type(e).__name__}: {e}")
+                    break
+                with lock:
+                    latencies.append(latency)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(virtual_user) for _ in range(concurrency)]
+    elapsed = time.perf_counter() - start
+
+    # Request errors are recorded above; anything else is a load-test bug
+    for future in futures:
+        future.result()
+
+    return summarize(latencies, errors, elapsed)
+
+
+def _percentile(ordered: list, fraction: float):
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summarize(latencies: list, errors: list, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    attempts = len(ordered) + len(errors)
+    return {
+        "requests": len(ordered),
+        "errors": len(errors),
+        "error_rate": len(errors) / attempts if attempts else 0.0,
+        "elapsed": elapsed,
+        "rps": len(ordered) / elapsed if elapsed else 0.0,
+        "p50": _percentile(ordered, 0.50),
+        "p95": _percentile(ordered, 0.95),
+        "p99": _percentile(ordered, 0.99),
+        "max": ordered[-1] if ordered else None,
+        "sample_errors": errors[:5],
+    }
+
+
+def check_regression(result: dict, baseline: dict, max_regression: float) -> list:
+    """Return human-readable regressions of error rate, p95 latency and rps against a baseline."""
+    if result["p95"] is None:
+        return ["no successful requests"]
+
+    regressions = []
+    baseline_error_rate = baseline.get("error_rate", 0.0)
+    if result["error_rate"] > baseline_error_rate:
+        regressions.append(f"error rate {result['error_rate']:.2%} > baseline {baseline_error_rate:.2%}")
+    if baseline.get("p95") and result["p95"] > baseline["p95"] * (1 + max_regression):
+        regressions.append(f"p95 {result['p95']:.3f}s > baseline {baseline['p95']:.3f}s (+{max_regression:.0%})")
+    if baseline.get("rps") and result["rps"] < baseline["rps"] * (1 - max_regression):
+        regressions.append(f"rps {result['rps']:.1f} < baseline {baseline['rps']:.1f} (-{max_regression:.0%})")
+    return regressions
+
+
+def config_mismatches(result: dict, baseline: dict) -> list:
+    """Return the run settings that differ from the baseline's."""
+    baseline_config = baseline.get("config", {})
+    return [
+        f"{key}: {baseline_config.get(key)!r} -> {value!r}"
+        for key, value in result["config"].items()
+        if baseline_config.get(key) != value
+    ]
+
+
+def redis_db(url: str) -> int:
+    """Return the database number of a redis:// URL (0 when not given)."""
+    path = urlparse(url).path.strip("/")
+    return int(path) if path else 0
+
+
+def run(args) -> int:
+    conversations = load_conversations(args.conversations)
+    base_url = args.url or f"http://127.0.0.1:{args.port}"
+    server = None if args.url else start_server(args)
+
+    try:
+        wait_until_healthy(base_url)
+        if args.warmup:
+            replay(base_url, conversations, args.concurrency, args.warmup)
+
+        lag_available = not args.url
+        if lag_available:
+            get_json(f"{base_url}/__loadtest/loop-lag?reset=true")
+        result = replay(base_url, conversations, args.concurrency, args.duration)
+        result["loop_lag"] = get_json(f"{base_url}/__loadtest/loop-lag") if lag_available else None
+    finally:
+        if server:
+            server.terminate()
+            server.wait(timeout=30)
+
+    result["config"] = {
+        "conversations": len(conversations),
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "workers": args.workers,
+        "checkpointer": args.checkpointer,
+        "llm_latency": args.llm_latency,
+        "db_latency": args.db_latency,
+    }
+
+    print(f"requests: {result['requests']}  errors: {result['errors']} ({result['error_rate']:.2%})  "
+          f"rps: {result['rps']:.1f}")
+    if result["p50"] is not None:
+        print(f"latency p50/p95/p99/max (s): {result['p50']:.3f} / {result['p95']:.3f} / "
+              f"{result['p99']:.3f} / {result['max']:.3f}")
+    if result["loop_lag"] and result["loop_lag"]["samples"]:
+        lag = result["loop_lag"]
+        print(f"event-loop lag p50/p99/max (ms): {lag['p50_ms']:.1f} / {lag['p99_ms']:.1f} / {lag['max_ms']:.1f}")
+        if args.workers > 1:
+            print("  (sampled from a single worker)")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        mismatches = config_mismatches(result, baseline)
+        if mismatches:
+            print("Refusing to compare, run settings differ from the baseline: " + "; ".join(mismatches))
+            return 1
+        regressions = check_regression(result, baseline, args.max_regression)
+        if regressions:
+            print("REGRESSION: " + "; ".join(regressions))
+            return 1
+        print("No regression against baseline")
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Export conversations from Redis audit records")
+    export_parser.add_argument("--output", required=True)
+    export_parser.add_argument("--limit", type=int, default=500)
+    export_parser.add_argument("--min-turns", type=int, default=1)
+
+    run_parser = subparsers.add_parser("run", help="Replay conversations and measure")
+    run_parser.add_argument("--conversations", help="JSON file from export (default: built-in samples)")
+    run_parser.add_argument("--url", help="Target an already running server instead of starting the stub app")
+    run_parser.add_argument("--port", type=int, default=8766)
+    run_parser.add_argument("--redis-url", default="redis://localhost:6379/15",
+                            help="Redis for the stub server, separate from recorded traffic")
+    run_parser.add_argument("--checkpointer", choices=("memory", "redis"), default="memory",
+                            help="Stub server checkpointer; redis needs --redis-url on database 0 "
+                                 "of a separate Redis Stack instance")
+    run_parser.add_argument("--workers", type=int, default=1, help="Server workers (gunicorn when > 1)")
+    run_parser.add_argument("--concurrency", type=int, default=8, help="Concurrent virtual users")
+    run_parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds")
+    run_parser.add_argument("--warmup", type=float, default=5.0, help="Unmeasured warmup seconds")
+    run_parser.add_argument("--llm-latency", type=float, default=0.5, help="Stub LLM latency per call (s)")
+    run_parser.add_argument("--db-latency", type=float, default=0.02, help="Stub MySQL latency per statement (s)")
+    run_parser.add_argument("--save-baseline", help="Write results to this JSON file")
+    run_parser.add_argument("--baseline", help="Compare against this baseline JSON file")
+    run_parser.add_argument("--max-regression", type=float, default=0.10,
+                            help="Allowed relative p95 increase / rps decrease (0-1)")
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        export_conversations(args.output, args.limit, args.min_turns)
+        sys.exit(0)
+    if args.checkpointer == "redis" and not args.url and redis_db(args.redis_url) != 0:
+        parser.error("--checkpointer redis needs --redis-url on database 0 (RediSearch indexes), "
+                     "e.g. a separate instance: redis://localhost:6380/0")
+    sys.exit(run(args))
+
+
+if __name__ == "__main__":
+    main()
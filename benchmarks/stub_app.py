@@ -0,0 +1,174 @@
+"""
+Benchmark app - the real FastAPI app with stubbed backends.
+
+Imports src.app (routes, service layer, Redis audit, full import graph) and
+replaces the startup hook. Requires Redis for the audit trail; the benchmark
+scripts point REDIS_URL at a separate database so benchmark threads never
+mix with recorded traffic. STUB_MODE selects what is stubbed:
+
+- "agent" (default): app.agent is a StubAgent whose blocking invoke()
+  sleeps for STUB_AGENT_LATENCY seconds, like a full agent turn.
+- "backends": the real LangGraph workflow runs, but every chat model call
+  sleeps STUB_LLM_LATENCY seconds and returns canned structured output,
+  and every MySQL statement sleeps STUB_DB_LATENCY seconds.
+
+Also exposes GET /__loadtest/loop-lag with event-loop lag measured by a
+background task that should wake up every LOOP_LAG_INTERVAL seconds. The
+monitor is per worker process: under gunicorn each call (including reset)
+reaches whichever single worker accepts it.
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+
+from langchain_core.messages import AIMessage
+
+from src.app import app
+from sales_info_agent.scoping_step.core.config.state_and_schemas import (
+    ClarifyWithUser,
+    CoolerSearchQuery,
+)
+
+STUB_MODE = os.getenv("STUB_MODE", "agent")
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.05"))
+
+
+class StubAgent:
+    """Stand-in for the compiled graph with a fixed blocking latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def invoke(self, inputs: dict, config: dict = None) -> dict:
+        time.sleep(self.latency)
+        return {
+            "messages": [*inputs["messages"], AIMessage(content="stub response")],
+            "sql_query": "SELECT 1",
+            "product_filters": None,
+        }
+
+
+STUB_OUTPUTS = {
+    ClarifyWithUser: ClarifyWithUser(
+        need_clarification=False,
+        question="",
+        verification="Entendi, vou consultar o banco de dados.",
+        confidence=1.0,
+    ),
+    CoolerSearchQuery: CoolerSearchQuery(
+        query_type="list",
+        cooler_criteria="stub",
+        sql_query="SELECT 1 AS coolerId",
+    ),
+}
+
+
+class StubStructuredModel:
+    """Structured-output runnable returning the canned instance for its schema."""
+
+    def __init__(self, schema, latency: float, include_raw: bool):
+        self.schema = schema
+        self.latency = latency
+        self.include_raw = include_raw
+
+    def invoke(self, messages):
+        time.sleep(self.latency)
+        parsed = STUB_OUTPUTS[self.schema]
+        if not self.include_raw:
+            return parsed
+        raw = AIMessage(content="", usage_metadata={"input_tokens": 0, "output_tokens": 0, "total_tokens": 0})
+        return {"raw": raw, "parsed": parsed, "parsing_error": None}
+
+
+class StubChatModel:
+    """Chat model stand-in with a fixed blocking latency per call."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def with_structured_output(self, schema, include_raw: bool = False):
+        return StubStructuredModel(schema, self.latency, include_raw)
+
+    def invoke(self, messages):
+        time.sleep(self.latency)
+        return AIMessage(content="Resposta formatada (stub).")
+
+
+def stub_execute_query_with_stats(sql_query: str, collect_rows_examined: bool = False):
+    latency = float(os.getenv("STUB_DB_LATENCY", "0.02"))
+    time.sleep(latency)
+    results = [{"coolerId": 1010001, "status": "in service"}]
+    stats = {"duration_ms": latency * 1000, "rows_returned": len(results), "rows_examined": len(results)}
+    return results, None, stats
+
+
+def stub_explain_query(sql_query: str):
+    time.sleep(float(os.getenv("STUB_DB_LATENCY", "0.02")))
+    return [{"table": "coolers", "type": "const"}], None
+
+
+def install_backend_stubs():
+    """Patch the chat model factory and MySQL calls used by the workflow nodes."""
+    from sales_info_agent.workflow import model_tiers
+    from sales_info_agent.scoping_step.core.config import scope_research
+    from sales_info_agent.execution_step.core.config import sql_executor
+
+    llm = StubChatModel(float(os.getenv("STUB_LLM_LATENCY", "0.5")))
+    model_tiers.get_chat_model = lambda model_name, temperature: llm
+    scope_research.explain_query = stub_explain_query
+    sql_executor.execute_query_with_stats = stub_execute_query_with_stats
+    # Keep stub statements out of the slow-query telemetry
+    sql_executor.record_query = lambda *args, **kwargs: None
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes a task that sleeps a fixed interval."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples = deque(maxlen=100_000)
+
+    async def run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - start - self.interval))
+
+    def snapshot(self, reset: bool = False) -> dict:
+        ordered = sorted(self.samples)
+        if reset:
+            self.samples.clear()
+        if not ordered:
+            return {"samples": 0, "p50_ms": None, "p99_ms": None, "max_ms": None}
+        return {
+            "samples": len(ordered),
+            "p50_ms": ordered[len(ordered) // 2] * 1000,
+            "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+            "max_ms": ordered[-1] * 1000,
+        }
+
+
+loop_lag_monitor = LoopLagMonitor(LOOP_LAG_INTERVAL)
+
+app.router.on_startup.clear()
+
+
+@app.on_event("startup")
+async def stub_startup_event():
+    if STUB_MODE == "backends":
+        from sales_info_agent.main import create_checkpointer
+        from sales_info_agent.workflow.cooler_agent_graph import cooler_agent_builder
+
+        install_backend_stubs()
+        app.agent = cooler_agent_builder.compile(checkpointer=create_checkpointer())
+    else:
+        app.agent = StubAgent(float(os.getenv("STUB_AGENT_LATENCY", "0.2")))
+
+    app.loop_lag_task = asyncio.create_task(loop_lag_monitor.run())
+
+
+@app.get("/__loadtest/loop-lag", include_in_schema=False)
+async def loop_lag(reset: bool = False):
+    return loop_lag_monitor.snapshot(reset=reset)
@@ -0,0 +1,124 @@
+"""
+Throughput benchmark for the multi-worker deployment profile.
+
+Starts gunicorn with gunicorn.conf.py and the stubbed app for each worker
+count, drives /search-sales-info at a fixed concurrency per worker and
+reports requests per second and scaling efficiency against one worker.
+
+Usage:
+    python -m benchmarks.worker_scaling --workers 1,2,4 --requests 400
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def wait_until_healthy(base_url: str, timeout: float = 60.0):
+    """Poll /health until the agent is initialized in a worker."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/health", timeout=2) as response:
+                if json.loads(response.read()).get("status") == "healthy":
+                    return
+        except OSError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"Server at {base_url} did not become healthy")
+
+
+def send_request(base_url: str, index: int) -> float:
+    """POST one search request and return its latency in seconds."""
+    body = json.dumps({"message": f"benchmark {index}", "thread_id": f"bench-{index}"}).encode()
+    request = urllib.request.Request(
+        f"{base_url}/search-sales-info",
+        data=body,
+        headers={"Content-Type": "application/json"},
+    )
+    start = time.perf_counter()
+    with urllib.request.urlopen(request, timeout=60) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def run_load(base_url: str, total_requests: int, concurrency: int) -> dict:
+    """Send total_requests with the given concurrency and measure throughput."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = sorted(executor.map(lambda i: send_request(base_url, i), range(total_requests)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "requests": total_requests,
+        "elapsed": elapsed,
+        "rps": total_requests / elapsed,
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+def benchmark_workers(workers: int, args) -> dict:
+    """Start gunicorn with the given worker count and run the load against it."""
+    base_url = f"http://127.0.0.1:{args.port}"
+    env = {
+        **os.environ,
+        "WEB_CONCURRENCY": str(workers),
+        "BIND": f"127.0.0.1:{args.port}",
+        "STUB_AGENT_LATENCY": str(args.latency),
+        "REDIS_URL": args.redis_url,
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "benchmarks.stub_app:app"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        wait_until_healthy(base_url)
+        # Warm up so every worker has finished its startup before measuring
+        run_load(base_url, workers * args.concurrency_per_worker, workers * args.concurrency_per_worker)
+        result = run_load(base_url, args.requests, workers * args.concurrency_per_worker)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    return {"workers": workers, **result}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--requests", type=int, default=400, help="Requests per run")
+    parser.add_argument("--concurrency-per-worker", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.2, help="Stub agent latency in seconds")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15",
+                        help="Redis for the benchmark server, separate from recorded traffic")
+    parser.add_argument("--min-efficiency", type=float, default=None,
+                        help="Exit non-zero if any run scales below this efficiency (0-1)")
+    args = parser.parse_args()
+
+    results = [benchmark_workers(int(w), args) for w in args.workers.split(",")]
+    baseline = results[0]["rps"] / results[0]["workers"]
+
+    print(f"{'workers':>8} {'rps':>10} {'p50 (s)':>10} {'p95 (s)':>10} {'efficiency':>11}")
+    failed = False
+    for result in results:
+        result["efficiency"] = result["rps"] / (baseline * result["workers"])
+        print(f"{result['workers']:>8} {result['rps']:>10.1f} {result['p50']:>10.3f} "
+              f"{result['p95']:>10.3f} {result['efficiency']:>10.0%}")
+        if args.min_efficiency is not None and result["efficiency"] < args.min_efficiency:
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Gunicorn configuration for multi-worker serving.
+
+Usage:
+    gunicorn -c gunicorn.conf.py
+
+Runs src.app:app on uvicorn workers. The app (and the whole LangChain /
+LangGraph import graph) is preloaded once in the master and shared by the
+forked workers. Each worker still builds its own agent, Redis and MySQL
+pools on startup, sized from the global budgets in worker_budget.py.
+
+Conversation state goes through the RedisSaver checkpointer so any worker
+can serve any turn of a thread.
+"""
+
+import multiprocessing
+import os
+
+wsgi_app = "src.app:app"
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", str(multiprocessing.cpu_count())))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Exposed before preloading so modules size their per-worker pools
+os.environ["WEB_CONCURRENCY"] = str(workers)
+os.environ.setdefault("CHECKPOINTER", "redis")
+
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = 30
+keepalive = 5
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = 100
+
+
+def post_fork(server, worker):
+    server.log.info(f"Worker {worker.pid} forked ({workers} workers)")
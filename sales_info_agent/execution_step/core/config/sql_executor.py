@@ -3,7 +3,11 @@ SQL Execution Node - Executes SQL queries against MySQL database.
 """
 
 from sales_info_agent.scoping_step.core.config.state_and_schemas import AgentState
-from sales_info_agent.execution_step.core.database.mysql_connection import execute_query
+from sales_info_agent.execution_step.core.database.mysql_connection import execute_query_with_stats
+from sales_info_agent.execution_step.core.database.query_telemetry import (
+    COLLECT_ROWS_EXAMINED,
+    record_query,
+)
 from langchain_core.messages import AIMessage
 
 
@@ -33,7 +37,13 @@ def execute_sql_query(state: AgentState) -> dict:
     print(sql_query)
     print(f"{'=' * 50}\n")
 
-    results, error = execute_query(sql_query)
+    user_messages = [msg for msg in state.get("messages", []) if getattr(msg, "type", None) == "human"]
+    user_question = user_messages[-1].content if user_messages else None
+
+    results, error, stats = execute_query_with_stats(
+        sql_query, collect_rows_examined=COLLECT_ROWS_EXAMINED
+    )
+    record_query(sql_query, stats, question=user_question, error=error)
 
     if error:
         return {
@@ -3,74 +3,197 @@ MySQL database connection and query execution.
 """
 
 import os
-import mysql.connector
-from mysql.connector import Error
+import time
+from threading import Lock
+from mysql.connector import Error, pooling
 from typing import List, Dict, Any, Optional
 
+from sales_info_agent.workflow.worker_budget import worker_share
+
+# mysql-connector-python caps a pool at 32 connections
+MAX_POOL_SIZE = 32
+
+# Seconds to wait for a free pooled connection before failing the query
+POOL_TIMEOUT = float(os.getenv("MYSQL_POOL_TIMEOUT", "10"))
+POOL_RETRY_INTERVAL = 0.05
+
+_pool = None
+_pool_lock = Lock()
+
+
+def _connection_config() -> dict:
+    """Build MySQL connection arguments from environment variables."""
+    return {
+        "host": os.getenv("MYSQL_HOST", "127.0.0.1"),
+        "port": int(os.getenv("MYSQL_PORT", "3306")),
+        "user": os.getenv("MYSQL_USER", "root"),
+        "password": os.getenv("MYSQL_PASSWORD", ""),
+        "database": os.getenv("MYSQL_DATABASE", "test_base"),
+    }
+
+
+def _get_pool() -> pooling.MySQLConnectionPool:
+    """
+    Return this process's connection pool, creating it on first use.
+
+    Created lazily so that each forked server worker builds its own pool.
+    MYSQL_POOL_SIZE is the total across all workers.
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = pooling.MySQLConnectionPool(
+                pool_name=f"sales_agent_{os.getpid()}",
+                pool_size=min(MAX_POOL_SIZE, worker_share("MYSQL_POOL_SIZE", 8)),
+                **_connection_config()
+            )
+        return _pool
+
 
 def get_mysql_connection():
     """
-    Create and return a MySQL connection using environment variables.
+    Get a MySQL connection from the per-process pool.
+
+    When the pool is exhausted, waits up to MYSQL_POOL_TIMEOUT seconds for
+    a connection to be returned; it never opens connections outside the pool.
+    Calling close() on a pooled connection returns it to the pool.
 
     Returns:
         MySQL connection object or None if connection fails
     """
+    deadline = time.monotonic() + POOL_TIMEOUT
+
     try:
-        connection = mysql.connector.connect(
-            host=os.getenv("MYSQL_HOST", "127.0.0.1"),
-            port=int(os.getenv("MYSQL_PORT", "3306")),
-            user=os.getenv("MYSQL_USER", "root"),
-            password=os.getenv("MYSQL_PASSWORD", ""),
-            database=os.getenv("MYSQL_DATABASE", "test_base")
-        )
+        while True:
+            try:
+                connection = _get_pool().get_connection()
+                break
+            except pooling.PoolError:
+                if time.monotonic() >= deadline:
+                    print(f"✗ MySQL pool exhausted for {POOL_TIMEOUT}s")
+                    return None
+                time.sleep(POOL_RETRY_INTERVAL)
 
         if connection.is_connected():
             print(f"✓ Connected to MySQL database: {connection.get_server_info()}")
             return connection
 
+        # Return the dropped connection to the pool instead of leaking its slot
+        connection.close()
+        return None
+
     except Error as e:
         print(f"✗ Error connecting to MySQL: {e}")
         return None
 
 
-def execute_query(sql_query: str) -> tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+def _last_statement_rows_examined(cursor) -> Optional[int]:
     """
-    Execute a SQL query and return results.
+    Read ROWS_EXAMINED of this session's last completed statement.
+
+    Uses performance_schema.events_statements_history (MySQL 8.0.16+ with
+    the history consumer enabled). Returns None when it is not available.
+    """
+    try:
+        cursor.execute(
+            "SELECT ROWS_EXAMINED FROM performance_schema.events_statements_history "
+            "WHERE THREAD_ID = PS_CURRENT_THREAD_ID() ORDER BY EVENT_ID DESC LIMIT 1"
+        )
+        row = cursor.fetchone()
+        return int(row["ROWS_EXAMINED"]) if row else None
+    except Error as e:
+        print(f"✗ Could not read rows examined: {e}")
+        return None
+
+
+def execute_query_with_stats(
+    sql_query: str,
+    collect_rows_examined: bool = False,
+) -> tuple[Optional[List[Dict[str, Any]]], Optional[str], Dict[str, Any]]:
+    """
+    Execute a SQL query and return results plus execution statistics.
 
     Args:
         sql_query: SQL SELECT query to execute
+        collect_rows_examined: Read rows examined from performance_schema
+            after the query (one extra round trip)
 
     Returns:
-        Tuple of (results, error_message)
-        - results: List of dictionaries with query results, or None if error
-        - error_message: Error message if query failed, or None if successful
+        Tuple of (results, error_message, stats)
+        - stats: duration_ms, rows_returned and rows_examined (None if not collected)
     """
     connection = None
     cursor = None
+    stats = {"duration_ms": None, "rows_returned": None, "rows_examined": None}
 
     try:
         connection = get_mysql_connection()
 
         if not connection:
-            return None, "Failed to connect to database"
+            return None, "Failed to connect to database", stats
 
         cursor = connection.cursor(dictionary=True)
-        cursor.execute(sql_query)
-        results = cursor.fetchall()
 
-        print(f"✓ Query executed successfully: {len(results)} rows returned")
-        return results, None
+        start = time.perf_counter()
+        try:
+            cursor.execute(sql_query)
+            results = cursor.fetchall()
+        finally:
+            stats["duration_ms"] = (time.perf_counter() - start) * 1000
+
+        stats["rows_returned"] = len(results)
+        if collect_rows_examined:
+            stats["rows_examined"] = _last_statement_rows_examined(cursor)
+
+        print(f"✓ Query executed successfully: {len(results)} rows returned in {stats['duration_ms']:.1f} ms")
+        return results, None, stats
 
     except Error as e:
         error_msg = f"MySQL Error: {str(e)}"
         print(f"✗ {error_msg}")
-        return None, error_msg
+        return None, error_msg, stats
 
     finally:
-        if cursor:
-            cursor.close()
-        if connection and connection.is_connected():
-            connection.close()
+        # Always close: for pooled connections this returns the slot, even if disconnected
+        try:
+            if cursor:
+                cursor.close()
+        finally:
+            if connection:
+                connection.close()
+
+
+def execute_query(sql_query: str) -> tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+    """
+    Execute a SQL query and return results.
+
+    Args:
+        sql_query: SQL SELECT query to execute
+
+    Returns:
+        Tuple of (results, error_message)
+        - results: List of dictionaries with query results, or None if error
+        - error_message: Error message if query failed, or None if successful
+    """
+    results, error, _ = execute_query_with_stats(sql_query)
+    return results, error
+
+
+def explain_query(sql_query: str) -> tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+    """
+    Run EXPLAIN for a SQL query without executing it.
+
+    Cheap way to validate generated SQL (syntax, tables, columns) and
+    fetch the query plan before the real execution.
+
+    Args:
+        sql_query: SQL SELECT query to explain
+
+    Returns:
+        Tuple of (plan_rows, error_message), same convention as execute_query
+    """
+    return execute_query(f"EXPLAIN {sql_query.strip().rstrip(';')}")
 
 
 def test_connection() -> bool:
@@ -88,11 +211,12 @@ def test_connection() -> bool:
             cursor.execute("SELECT 1")
             cursor.fetchone()
             cursor.close()
-            connection.close()
             print("✓ Database connection test successful")
             return True
         except Error as e:
             print(f"✗ Database connection test failed: {e}")
             return False
+        finally:
+            connection.close()
 
     return False
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+Query Telemetry - Rolling store of executed SQL statements and their cost.
+
+Every statement run by the execution step is recorded with its normalized
+fingerprint, duration, rows examined/returned and the user question that
+produced it. Records live in a capped Redis list shared by all workers
+(QUERY_TELEMETRY_MAX_ENTRIES most recent statements).
+
+The diagnostics helpers aggregate records by fingerprint and suggest
+indexes for statements that examine many more rows than they return.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sales_info_agent.execution_step.core.database.mysql_connection import explain_query
+from sales_info_agent.execution_step.core.database.sql_analysis import (
+    fingerprint,
+    normalize_query,
+    suggest_indexes,
+)
+from sales_info_agent.workflow.redis_clients import get_redis_client
+
+TELEMETRY_KEY = "query_telemetry"
+MAX_ENTRIES = int(os.getenv("QUERY_TELEMETRY_MAX_ENTRIES", "5000"))
+# Opt-in: one extra performance_schema round trip per executed statement
+COLLECT_ROWS_EXAMINED = os.getenv("QUERY_TELEMETRY_ROWS_EXAMINED", "false").lower() == "true"
+
+# EXPLAIN round trips per /diagnostics/slow-queries call
+MAX_EXPLAINS = int(os.getenv("QUERY_TELEMETRY_MAX_EXPLAINS", "5"))
+
+# Statements examining at least this many rows per returned row get index suggestions
+EXAMINED_RATIO_THRESHOLD = float(os.getenv("QUERY_TELEMETRY_EXAMINED_RATIO", "100"))
+
+
+def record_query(
+    sql_query: str,
+    stats: Dict[str, Any],
+    question: Optional[str] = None,
+    error: Optional[str] = None,
+):
+    """
+    Append one executed statement to the rolling store.
+
+    Never raises: telemetry failures are logged and the query result is unaffected.
+    """
+    normalized = normalize_query(sql_query)
+    entry = {
+        "fingerprint": fingerprint(normalized),
+        "normalized": normalized,
+        "sql": sql_query,
+        "question": (question or "")[:500],
+        "duration_ms": stats.get("duration_ms"),
+        "rows_returned": stats.get("rows_returned"),
+        "rows_examined": stats.get("rows_examined"),
+        "error": error,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+    try:
+        pipe = get_redis_client().pipeline()
+        pipe.lpush(TELEMETRY_KEY, json.dumps(entry, ensure_ascii=False, default=str))
+        pipe.ltrim(TELEMETRY_KEY, 0, MAX_ENTRIES - 1)
+        pipe.execute()
+    except Exception as e:
+        print(f"✗ Failed to record query telemetry: {e}")
+
+
+def get_recent_queries(window: int = MAX_ENTRIES) -> List[Dict[str, Any]]:
+    """Return up to `window` most recent telemetry records, newest first."""
+    return [json.loads(raw) for raw in get_redis_client().lrange(TELEMETRY_KEY, 0, window - 1)]
+
+
+def _percentile(values: List[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def aggregate_by_fingerprint(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Group telemetry records by fingerprint.
+
+    Returns:
+        One entry per fingerprint, sorted by total time spent (descending)
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        groups.setdefault(record["fingerprint"], []).append(record)
+
+    aggregates = []
+    for fp, group in groups.items():
+        durations = [r["duration_ms"] for r in group if r.get("duration_ms") is not None]
+        returned = [r["rows_returned"] for r in group if r.get("rows_returned") is not None]
+        examined = [r["rows_examined"] for r in group if r.get("rows_examined") is not None]
+
+        avg_returned = sum(returned) / len(returned) if returned else None
+        avg_examined = sum(examined) / len(examined) if examined else None
+
+        aggregates.append({
+            "fingerprint": fp,
+            "normalized": group[0]["normalized"],
+            "sample_sql": group[0]["sql"],
+            "sample_question": group[0]["question"],
+            "count": len(group),
+            "errors": sum(1 for r in group if r.get("error")),
+            "total_ms": sum(durations),
+            "avg_ms": sum(durations) / len(durations) if durations else None,
+            "p95_ms": _percentile(durations, 0.95),
+            "max_ms": max(durations) if durations else None,
+            "avg_rows_returned": avg_returned,
+            "avg_rows_examined": avg_examined,
+            "examined_per_returned": (
+                avg_examined / max(avg_returned, 1) if avg_examined is not None and avg_returned is not None else None
+            ),
+            "last_seen": group[0]["timestamp"],
+        })
+
+    return sorted(aggregates, key=lambda a: a["total_ms"], reverse=True)
+
+
+def get_slow_queries(
+    limit: int = 20,
+    min_avg_ms: float = 0.0,
+    window: int = MAX_ENTRIES,
+    max_explains: int = MAX_EXPLAINS,
+) -> List[Dict[str, Any]]:
+    """
+    Aggregate recent statements by fingerprint and attach index suggestions.
+
+    Index suggestions are added when a fingerprint examines many rows per
+    returned row, or when EXPLAIN on its sample shows a full table scan.
+    Blocking (Redis + MySQL); call it from a worker thread, not the event loop.
+
+    Args:
+        limit: Maximum number of fingerprints to return
+        min_avg_ms: Skip fingerprints faster than this on average
+        window: Number of most recent records to aggregate
+        max_explains: EXPLAIN only the sample statements of the first N fingerprints
+
+    Returns:
+        Aggregates sorted by total time, each with explained, full_scan_tables
+        and suggested_indexes
+    """
+    aggregates = [
+        aggregate for aggregate in aggregate_by_fingerprint(get_recent_queries(window))
+        if (aggregate["avg_ms"] or 0) >= min_avg_ms
+    ][:limit]
+
+    for position, aggregate in enumerate(aggregates):
+        full_scan_tables = []
+        explained = position < max_explains
+        if explained:
+            plan, error = explain_query(aggregate["sample_sql"])
+            if error:
+                aggregate["explain_error"] = error
+            else:
+                full_scan_tables = [
+                    row.get("table") for row in plan
+                    if row.get("type") == "ALL" and row.get("table")
+                ]
+
+        ratio = aggregate["examined_per_returned"]
+        needs_index = bool(full_scan_tables) or (ratio is not None and ratio >= EXAMINED_RATIO_THRESHOLD)
+
+        aggregate["explained"] = explained
+        aggregate["full_scan_tables"] = full_scan_tables
+        aggregate["suggested_indexes"] = suggest_indexes(aggregate["sample_sql"]) if needs_index else []
+
+    return aggregates
@@ -0,0 +1,130 @@
+"""
+SQL Analysis - Pure helpers to fingerprint statements and suggest indexes.
+
+No database or Redis access, so they can be unit tested in isolation.
+"""
+
+import hashlib
+import re
+from typing import Dict, List
+
+
+def normalize_query(sql_query: str) -> str:
+    """
+    Normalize a SQL statement so queries differing only in literals share a fingerprint.
+
+    Replaces string and numeric literals with ?, collapses IN lists and
+    whitespace, lower-cases keywords and drops the trailing semicolon.
+    """
+    normalized = sql_query.strip().rstrip(";")
+    normalized = re.sub(r"'(?:[^'\\]|\\.|'')*'", "?", normalized)
+    normalized = re.sub(r'"(?:[^"\\]|\\.)*"', "?", normalized)
+    normalized = re.sub(r"\b\d+(?:\.\d+)?\b", "?", normalized)
+    normalized = re.sub(r"\s+", " ", normalized).lower()
+    normalized = re.sub(r"\bin \(\s*\?(?:\s*,\s*\?)*\s*\)", "in (?+)", normalized)
+    return normalized
+
+
+def fingerprint(normalized_query: str) -> str:
+    """Short stable identifier for a normalized statement."""
+    return hashlib.sha1(normalized_query.encode()).hexdigest()[:16]
+
+
+_SQL_KEYWORDS = {
+    "and", "or", "not", "null", "is", "in", "like", "between", "select",
+    "from", "where", "as", "on", "exists", "case", "when", "then", "else", "end",
+}
+
+# Words that can follow a table name without being its alias
+_ALIAS_STOPWORDS = _SQL_KEYWORDS | {
+    "join", "left", "right", "inner", "outer", "cross", "group", "order", "limit", "having", "using",
+}
+
+
+def _table_aliases(sql_query: str) -> Dict[str, str]:
+    """Map aliases (and bare table names) to tables from FROM/JOIN clauses."""
+    aliases = {}
+    pattern = r"\b(?:from|join)\s+`?(\w+)`?(?:\s+(?:as\s+)?`?(\w+)`?)?"
+    for table, alias in re.findall(pattern, sql_query, flags=re.IGNORECASE):
+        aliases[table.lower()] = table
+        if alias and alias.lower() not in _ALIAS_STOPWORDS:
+            aliases[alias.lower()] = table
+    return aliases
+
+
+def _where_clause(sql_query: str) -> str:
+    """Return the WHERE clause body with string literals blanked out ("" if none)."""
+    without_literals = re.sub(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"", "?", sql_query)
+    match = re.search(
+        r"\bwhere\b(.*?)(?:\bgroup\s+by\b|\border\s+by\b|\blimit\b|\bhaving\b|$)",
+        without_literals,
+        flags=re.IGNORECASE | re.DOTALL,
+    )
+    return match.group(1) if match else ""
+
+
+def _disjuncts(where_clause: str) -> List[str]:
+    """
+    Split a WHERE clause into OR branches.
+
+    Parenthesized groups containing OR are dropped (no single index serves
+    them); the remaining top-level OR branches are returned separately, since
+    MySQL can only use one index per branch (index merge union).
+    """
+    nested_or = r"\([^()]*\bor\b[^()]*\)"
+    while re.search(nested_or, where_clause, flags=re.IGNORECASE):
+        where_clause = re.sub(nested_or, " ", where_clause, flags=re.IGNORECASE)
+    return re.split(r"\bor\b", where_clause, flags=re.IGNORECASE)
+
+
+def _predicates(condition: str) -> List[tuple]:
+    """
+    Extract (qualifier, column, kind) from an AND-only condition.
+
+    kind is "eq" for = / IN and "range" for <, >, <=, >=, BETWEEN.
+    """
+    predicates = []
+    pattern = r"(?:`?(\w+)`?\.)?`?(\w+)`?\s*(=|\bin\s*\(|>=|<=|<>|!=|>|<|\bbetween\b)"
+    for qualifier, column, operator in re.findall(pattern, condition, flags=re.IGNORECASE):
+        if column.lower() in _SQL_KEYWORDS or operator in ("<>", "!="):
+            continue
+        kind = "eq" if operator == "=" or operator.lower().startswith("in") else "range"
+        predicates.append((qualifier.lower(), column, kind))
+    return predicates
+
+
+def suggest_indexes(sql_query: str) -> List[str]:
+    """
+    Suggest composite indexes for a statement from its WHERE predicates.
+
+    Equality columns come first, followed by at most one range column,
+    one suggestion per table and OR branch. Heuristic only; review before applying.
+    """
+    aliases = _table_aliases(sql_query)
+    tables = sorted(set(aliases.values()))
+    suggestions = []
+
+    for condition in _disjuncts(_where_clause(sql_query)):
+        columns_by_table: Dict[str, Dict[str, List[str]]] = {}
+
+        for qualifier, column, kind in _predicates(condition):
+            if qualifier:
+                table = aliases.get(qualifier)
+            else:
+                table = tables[0] if len(tables) == 1 else None
+            if not table:
+                continue
+            columns = columns_by_table.setdefault(table, {"eq": [], "range": []})
+            if column not in columns["eq"] and column not in columns["range"]:
+                columns[kind].append(column)
+
+        for table, columns in columns_by_table.items():
+            index_columns = columns["eq"] + columns["range"][:1]
+            if not index_columns:
+                continue
+            name = f"idx_{table}_{'_'.join(index_columns)}"[:64]
+            suggestion = f"CREATE INDEX {name} ON {table} ({', '.join(index_columns)});"
+            if suggestion not in suggestions:
+                suggestions.append(suggestion)
+
+    return suggestions
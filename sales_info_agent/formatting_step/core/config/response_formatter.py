@@ -3,12 +3,10 @@ Response Formatting Node - Formats SQL results into natural language.
 """
 
 import json
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, AIMessage
 from sales_info_agent.scoping_step.core.config.state_and_schemas import AgentState
 from sales_info_agent.formatting_step.core.prompts.formatting import format_sql_results_prompt
-
-model = init_chat_model(model="openai:gpt-4o", temperature=0.3)
+from sales_info_agent.workflow.model_tiers import invoke_with_cascade
 
 
 def format_response(state: AgentState) -> dict:
@@ -53,13 +51,21 @@ def format_response(state: AgentState) -> dict:
     print(f"Results Count: {len(sql_results)}")
     print(f"{'=' * 50}\n")
 
-    formatted_text = model.invoke([
+    prompt = [
         HumanMessage(content=format_sql_results_prompt.format(
             user_question=user_question,
             sql_query=sql_query,
             sql_results=results_json
         ))
-    ])
+    ]
+
+    # Small model first; empty output escalates to the large model
+    formatted_text = invoke_with_cascade(
+        "format_response",
+        temperature=0.3,
+        call=lambda model: model.invoke(prompt),
+        accept=lambda response: bool(str(response.content).strip()),
+    )
 
     formatted_content = formatted_text.content
 
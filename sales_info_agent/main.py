@@ -10,21 +10,48 @@ This module centralizes the execution of the complete cooler agent workflow:
 from dotenv import load_dotenv
 load_dotenv()
 
+import os
+
 from langgraph.checkpoint.memory import MemorySaver
 from langchain_core.messages import HumanMessage
 from sales_info_agent.workflow.cooler_agent_graph import cooler_agent_builder
 from sales_info_agent.execution_step.core.database.mysql_connection import test_connection
 
 
+def create_checkpointer():
+    """
+    Create the checkpointer selected by the CHECKPOINTER environment variable.
+
+    - "memory" (default): MemorySaver, conversation state lives in this process
+    - "redis": RedisSaver on REDIS_URL (Redis Stack), shared by all workers,
+      using the checkpointer's pooled client from the worker's Redis budget
+
+    Multi-worker deployments must use "redis", otherwise a follow-up message
+    routed to another worker loses the conversation. gunicorn.conf.py sets it.
+    """
+    backend = os.getenv("CHECKPOINTER", "memory").lower()
+
+    if backend == "redis":
+        from langgraph.checkpoint.redis import RedisSaver
+        from sales_info_agent.workflow.redis_clients import get_checkpointer_redis_client
+
+        checkpointer = RedisSaver(redis_client=get_checkpointer_redis_client())
+        checkpointer.setup()
+        print("✓ Using RedisSaver checkpointer")
+        return checkpointer
+
+    if backend != "memory":
+        raise ValueError(f"Unknown CHECKPOINTER backend: {backend}")
+
+    return MemorySaver()
+
+
 def create_sales_info_search_agent():
     """
-    Create and compile the cooler query agent with Memory checkpointer.
+    Create and compile the cooler query agent.
 
     Returns:
-        Compiled cooler agent graph with in-memory state
-
-    Note: Uses MemorySaver for development. For production with Redis Stack,
-          replace with: RedisSaver(REDIS_URL)
+        Compiled cooler agent graph with the checkpointer from create_checkpointer()
     """
     print("\n" + "="*50)
     print("COOLER AGENT INITIALIZATION")
@@ -37,7 +64,7 @@ def create_sales_info_search_agent():
 
     print("="*50 + "\n")
 
-    checkpointer = MemorySaver()
+    checkpointer = create_checkpointer()
     return cooler_agent_builder.compile(checkpointer=checkpointer)
 
 
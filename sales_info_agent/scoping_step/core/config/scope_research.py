@@ -4,10 +4,12 @@ User Clarification and SQL Query Generation.
 This module implements the scoping phase of the cooler query workflow.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing_extensions import Literal
+from threading import Event
+from typing_extensions import Literal, Optional
 
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, AIMessage, get_buffer_string
 from langgraph.types import Command
 
@@ -20,6 +22,35 @@ from sales_info_agent.scoping_step.core.config.state_and_schemas import (
     ClarifyWithUser,
     CoolerSearchQuery,
 )
+from sales_info_agent.execution_step.core.database.mysql_connection import explain_query
+from sales_info_agent.workflow.metrics import speculation_metrics
+from sales_info_agent.workflow.worker_budget import worker_share
+from sales_info_agent.workflow.model_tiers import (
+    CONFIDENCE_THRESHOLD,
+    get_node_model_names,
+    invoke_with_cascade,
+)
+
+
+# Appended to clarify_with_user_instructions; the cascade escalates below CONFIDENCE_THRESHOLD
+confidence_instructions = """
+
+Also return "confidence": a number from 0.0 to 1.0 for how certain you are about need_clarification.
+Use 1.0 when the request is unambiguous, around 0.5 when you are unsure whether a clarifying
+question is needed, and below 0.3 when you are mostly guessing.
+"""
+
+
+# Appended to the SQL prompt when regenerating SQL that failed EXPLAIN
+rejected_sql_instructions = """
+
+A previous attempt produced this SQL, which MySQL rejected:
+{sql_query}
+
+Error: {error}
+
+Write a corrected query that avoids this error.
+"""
 
 
 def get_today_str() -> str:
@@ -27,7 +58,105 @@ def get_today_str() -> str:
     return datetime.now().strftime("%a %b %-d, %Y")
 
 
-model = init_chat_model(model="openai:gpt-4o", temperature=0.0)
+# Runs the speculative SQL branch next to the clarification decision;
+# SPECULATION_MAX_WORKERS is the total across all server workers
+speculation_executor = ThreadPoolExecutor(
+    max_workers=worker_share("SPECULATION_MAX_WORKERS", 4),
+    thread_name_prefix="speculative-sql",
+)
+
+
+def _decide_clarification(messages) -> ClarifyWithUser:
+    """
+    Ask the model whether the conversation needs a clarifying question.
+
+    Runs on the small model and escalates on schema-validation failure or
+    when the reported confidence is below CONFIDENCE_THRESHOLD.
+    """
+    prompt = [
+        HumanMessage(
+            content=clarify_with_user_instructions.format(
+                messages=get_buffer_string(messages=messages),
+                date=get_today_str(),
+            ) + confidence_instructions
+        )
+    ]
+
+    return invoke_with_cascade(
+        "clarify_with_user",
+        temperature=0.0,
+        call=lambda model: model.with_structured_output(ClarifyWithUser).invoke(prompt),
+        accept=lambda response: response.confidence >= CONFIDENCE_THRESHOLD,
+    )
+
+
+def _invoke_sql_model(model, prompt) -> tuple[CoolerSearchQuery, int]:
+    """Invoke one model for SQL generation, raising on schema-validation failure."""
+    structured_output_model = model.with_structured_output(
+        CoolerSearchQuery, include_raw=True
+    )
+
+    output = structured_output_model.invoke(prompt)
+
+    if output.get("parsing_error"):
+        raise output["parsing_error"]
+
+    usage = getattr(output["raw"], "usage_metadata", None) or {}
+    return output["parsed"], usage.get("total_tokens", 0)
+
+
+def _sql_passes_explain(output: tuple[CoolerSearchQuery, int]) -> bool:
+    """Accept small-model SQL only if MySQL can EXPLAIN it."""
+    _, error = explain_query(output[0].sql_query)
+    return error is None
+
+
+def _generate_sql(messages, rejected_sql: Optional[dict] = None) -> tuple[CoolerSearchQuery, int]:
+    """
+    Ask the model for the SQL query answering the conversation.
+
+    When a small model is configured for write_sql_query, its SQL is
+    checked with EXPLAIN and escalated to the large model on SQL errors.
+
+    Args:
+        messages: Conversation history
+        rejected_sql: Optional {"sql_query", "error"} of a previous attempt
+            that failed EXPLAIN, shown to the model so it can fix it
+
+    Returns:
+        Tuple of (parsed CoolerSearchQuery, total tokens used by the call)
+    """
+    content = transform_messages_into_research_topic_prompt.format(
+        messages=get_buffer_string(messages),
+        date=get_today_str(),
+    )
+    if rejected_sql:
+        content += rejected_sql_instructions.format(**rejected_sql)
+
+    prompt = [HumanMessage(content=content)]
+
+    return invoke_with_cascade(
+        "write_sql_query",
+        temperature=0.0,
+        call=lambda model: _invoke_sql_model(model, prompt),
+        accept=_sql_passes_explain,
+    )
+
+
+def _sql_query_update(response: CoolerSearchQuery) -> dict:
+    """Build the state update produced by a generated SQL query."""
+    product_filters = {
+        "query_type": response.query_type,
+        "cooler_criteria": response.cooler_criteria,
+    }
+
+    return {
+        "sql_query": response.sql_query,
+        "product_filters": product_filters,
+        "supervisor_messages": [
+            HumanMessage(content=f"SQL Query generated: {response.query_type} query")
+        ],
+    }
 
 
 def clarify_with_user(
@@ -39,18 +168,7 @@ def clarify_with_user(
     Uses structured output to make deterministic decisions.
     Routes to either SQL query generation or ends with a clarification question.
     """
-    structured_output_model = model.with_structured_output(ClarifyWithUser)
-
-    response = structured_output_model.invoke(
-        [
-            HumanMessage(
-                content=clarify_with_user_instructions.format(
-                    messages=get_buffer_string(messages=state["messages"]),
-                    date=get_today_str(),
-                )
-            )
-        ]
-    )
+    response = _decide_clarification(state["messages"])
 
     if response.need_clarification:
         return Command(
@@ -70,28 +188,95 @@ def write_sql_query(state: AgentState):
 
     Uses structured output to ensure the query follows the required format.
     """
-    structured_output_model = model.with_structured_output(CoolerSearchQuery)
-
-    response = structured_output_model.invoke(
-        [
-            HumanMessage(
-                content=transform_messages_into_research_topic_prompt.format(
-                    messages=get_buffer_string(state.get("messages", [])),
-                    date=get_today_str(),
-                )
-            )
-        ]
-    )
+    response, _ = _generate_sql(state.get("messages", []), state.get("rejected_sql"))
+    update = _sql_query_update(response)
+    update["rejected_sql"] = None
+    return update
 
-    product_filters = {
-        "query_type": response.query_type,
-        "cooler_criteria": response.cooler_criteria,
-    }
 
-    return {
-        "sql_query": response.sql_query,
-        "product_filters": product_filters,
-        "supervisor_messages": [
-            HumanMessage(content=f"SQL Query generated: {response.query_type} query")
-        ],
-    }
\ No newline at end of file
+def _speculative_sql_branch(messages, explain: bool, discarded: Event) -> tuple[CoolerSearchQuery, int, Optional[str]]:
+    """
+    Generate SQL and, optionally, EXPLAIN it while clarification is still running.
+
+    The EXPLAIN is skipped when the branch was already discarded, and when
+    the write_sql_query cascade has EXPLAINed the SQL itself (small != large).
+
+    Returns:
+        Tuple of (parsed query, tokens used, explain_error)
+    """
+    response, tokens = _generate_sql(messages)
+
+    small_name, large_name = get_node_model_names("write_sql_query")
+    if not explain or discarded.is_set() or small_name != large_name:
+        return response, tokens, None
+
+    _, explain_error = explain_query(response.sql_query)
+    speculation_metrics.record_explain(error=explain_error is not None)
+    return response, tokens, explain_error
+
+
+def _record_wasted_branch(future):
+    """Done-callback for a discarded SQL branch: count the tokens it consumed."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    _, tokens, _ = future.result()
+    speculation_metrics.record_wasted_tokens(tokens)
+
+
+def clarify_and_write_sql_query(
+    state: AgentState,
+) -> Command[Literal["execute_sql_query", "write_sql_query", "__end__"]]:
+    """
+    Speculatively run the clarification decision and SQL generation in parallel.
+
+    Most turns need no clarification, so generating SQL alongside the
+    decision removes one LLM hop from the critical path. When clarification
+    is needed, the SQL branch is cancelled if it has not started yet,
+    otherwise its result is discarded and its tokens are counted as wasted.
+
+    With SPECULATIVE_EXPLAIN=true the SQL is also EXPLAINed in the branch;
+    SQL that fails EXPLAIN is not executed but regenerated by write_sql_query,
+    with the rejected SQL and the MySQL error added to its prompt.
+    """
+    messages = state["messages"]
+    explain = os.getenv("SPECULATIVE_EXPLAIN", "false").lower() == "true"
+    discarded = Event()
+
+    sql_future = speculation_executor.submit(_speculative_sql_branch, messages, explain, discarded)
+    decision = _decide_clarification(messages)
+
+    if decision.need_clarification:
+        discarded.set()
+        cancelled = sql_future.cancel()
+        if not cancelled:
+            sql_future.add_done_callback(_record_wasted_branch)
+        speculation_metrics.record_miss(cancelled=cancelled)
+
+        return Command(
+            goto="__end__",
+            update={"messages": [AIMessage(content=decision.question)]},
+        )
+
+    response, tokens, explain_error = sql_future.result()
+
+    if explain_error:
+        # The decision was right but the SQL is discarded: its tokens are wasted
+        speculation_metrics.record_hit(0)
+        speculation_metrics.record_wasted_tokens(tokens)
+        return Command(
+            goto="write_sql_query",
+            update={
+                "messages": [AIMessage(content=decision.verification)],
+                "rejected_sql": {"sql_query": response.sql_query, "error": explain_error},
+                "supervisor_messages": [
+                    AIMessage(content=f"EXPLAIN failed for speculative SQL, regenerating: {explain_error}")
+                ],
+            },
+        )
+
+    speculation_metrics.record_hit(tokens)
+
+    update = _sql_query_update(response)
+    update["messages"] = [AIMessage(content=decision.verification)]
+
+    return Command(goto="execute_sql_query", update=update)
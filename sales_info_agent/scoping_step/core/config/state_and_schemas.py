@@ -24,6 +24,7 @@ class AgentState(MessagesState):
 
     sql_query: Optional[str] = None
     product_filters: Optional[dict] = None
+    rejected_sql: Optional[dict] = None
 
     sql_results: Optional[List[Dict[str, Any]]] = None
     sql_error: Optional[str] = None
@@ -48,6 +49,11 @@ class ClarifyWithUser(BaseModel):
     verification: str = Field(
         description="Verification message that we have sufficient information and will generate the SQL query.",
     )
+    confidence: float = Field(
+        description="Confidence in the need_clarification decision, from 0.0 (guess) to 1.0 (certain).",
+        ge=0.0,
+        le=1.0,
+    )
 
 
 class CoolerSearchQuery(BaseModel):
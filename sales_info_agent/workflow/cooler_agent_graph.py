@@ -6,8 +6,13 @@ This module defines the complete workflow for the cooler query agent:
 2. Write SQL query (scoping)
 3. Execute SQL query (execution)
 4. Format response (formatting)
+
+With speculative scoping enabled, steps 1 and 2 run concurrently in a single
+node and the SQL branch is discarded when clarification is needed.
 """
 
+import os
+
 from langgraph.graph import StateGraph, START, END
 from langgraph.types import Command
 
@@ -18,28 +23,41 @@ from sales_info_agent.scoping_step.core.config.state_and_schemas import (
 from sales_info_agent.scoping_step.core.config.scope_research import (
     clarify_with_user,
     write_sql_query,
+    clarify_and_write_sql_query,
 )
 from sales_info_agent.execution_step.core.config.sql_executor import execute_sql_query
 from sales_info_agent.formatting_step.core.config.response_formatter import format_response
 
 
-def build_cooler_agent_graph() -> StateGraph:
+def build_cooler_agent_graph(speculative: bool = False) -> StateGraph:
     """
     Build the complete cooler agent workflow graph.
 
+    Args:
+        speculative: Run clarification and SQL generation concurrently
+            instead of sequentially
+
     Returns:
         Compiled StateGraph ready for execution
     """
 
     builder = StateGraph(AgentState, input_schema=AgentInputState)
 
-    builder.add_node("clarify_with_user", clarify_with_user)
+    if speculative:
+        builder.add_node("clarify_and_write_sql_query", clarify_and_write_sql_query)
+    else:
+        builder.add_node("clarify_with_user", clarify_with_user)
     builder.add_node("write_sql_query", write_sql_query)
     builder.add_node("execute_sql_query", execute_sql_query)
     builder.add_node("format_response", format_response)
 
-    builder.add_edge(START, "clarify_with_user")
-    # Note: clarify_with_user returns a Command that routes to either write_sql_query or END
+    if speculative:
+        builder.add_edge(START, "clarify_and_write_sql_query")
+        # Note: clarify_and_write_sql_query returns a Command that routes to execute_sql_query, END,
+        # or write_sql_query when the speculative SQL failed EXPLAIN
+    else:
+        builder.add_edge(START, "clarify_with_user")
+        # Note: clarify_with_user returns a Command that routes to either write_sql_query or END
     builder.add_edge("write_sql_query", "execute_sql_query")
     builder.add_edge("execute_sql_query", "format_response")
     builder.add_edge("format_response", END)
@@ -47,4 +65,6 @@ def build_cooler_agent_graph() -> StateGraph:
     return builder
 
 
-cooler_agent_builder = build_cooler_agent_graph()
\ No newline at end of file
+cooler_agent_builder = build_cooler_agent_graph(
+    speculative=os.getenv("SPECULATIVE_SCOPING", "false").lower() == "true"
+)
\ No newline at end of file
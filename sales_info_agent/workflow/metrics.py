@@ -0,0 +1,154 @@
+"""
+Workflow Metrics - Counters for the cooler agent workflow, shared through Redis.
+
+Tracks how often speculative SQL generation pays off (hit rate), how many
+LLM tokens are spent on SQL that ends up discarded (wasted tokens), and
+per-node latency and quality of the small/large model cascade.
+
+Counters live in Redis hashes (HINCRBY / HINCRBYFLOAT), so every server
+worker adds to the same totals and the diagnostics endpoints report the
+whole deployment. Recording never raises: a Redis failure is logged and
+the workflow continues.
+"""
+
+from sales_info_agent.workflow.redis_clients import get_redis_client
+
+SPECULATION_KEY = "metrics:speculation"
+MODEL_TIERS_KEY = "metrics:model_tiers"
+
+
+def _increment(key: str, increments: dict, values: dict = None):
+    """Apply several hash increments (and plain sets) in one round trip, logging failures."""
+    try:
+        pipe = get_redis_client().pipeline()
+        if values:
+            pipe.hset(key, mapping=values)
+        for field, amount in increments.items():
+            if isinstance(amount, float):
+                pipe.hincrbyfloat(key, field, amount)
+            else:
+                pipe.hincrby(key, field, amount)
+        pipe.execute()
+    except Exception as e:
+        print(f"✗ Failed to record metrics in {key}: {e}")
+
+
+class SpeculationMetrics:
+    """
+    Counters for speculative clarification + SQL generation.
+
+    A "hit" is a turn where no clarification was needed, so the speculatively
+    generated SQL is used. A "miss" is a turn where clarification was needed
+    and the SQL branch was cancelled or its result discarded.
+    """
+
+    FIELDS = ("hits", "misses", "cancelled", "used_tokens", "wasted_tokens", "explain_runs", "explain_errors")
+
+    def __init__(self, key: str = SPECULATION_KEY):
+        self.key = key
+
+    def reset(self):
+        """Reset all counters to zero."""
+        get_redis_client().delete(self.key)
+
+    def record_hit(self, tokens: int = 0):
+        """Record a turn where the speculative SQL was used."""
+        _increment(self.key, {"hits": 1, "used_tokens": tokens})
+
+    def record_miss(self, cancelled: bool = False):
+        """Record a turn where clarification was needed and the SQL branch was dropped."""
+        _increment(self.key, {"misses": 1, "cancelled": int(cancelled)})
+
+    def record_wasted_tokens(self, tokens: int):
+        """Add tokens consumed by a discarded SQL branch."""
+        _increment(self.key, {"wasted_tokens": tokens})
+
+    def record_explain(self, error: bool = False):
+        """Record an early EXPLAIN run on speculative SQL."""
+        _increment(self.key, {"explain_runs": 1, "explain_errors": int(error)})
+
+    def snapshot(self) -> dict:
+        """
+        Return the current counters across all workers.
+
+        Returns:
+            Dictionary with raw counters plus hit_rate (None before any turn)
+        """
+        stored = get_redis_client().hgetall(self.key)
+        counters = {field: int(stored.get(field, 0)) for field in self.FIELDS}
+        total = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = (counters["hits"] / total) if total else None
+        return counters
+
+
+speculation_metrics = SpeculationMetrics()
+
+
+class ModelTierMetrics:
+    """
+    Per-node counters for the small/large model cascade.
+
+    For every node and tier it records calls, failures (exception or
+    rejected output) and cumulative latency, plus how often the node
+    escalated from the small to the large model. Hash fields are
+    "<node>|<tier>|<counter>" and "<node>|escalations".
+    """
+
+    def __init__(self, key: str = MODEL_TIERS_KEY):
+        self.key = key
+
+    def reset(self):
+        """Reset all counters."""
+        get_redis_client().delete(self.key)
+
+    def record_call(self, node: str, tier: str, model: str, latency: float, ok: bool):
+        """Record one model call for a node."""
+        _increment(
+            self.key,
+            {
+                f"{node}|{tier}|calls": 1,
+                f"{node}|{tier}|failures": int(not ok),
+                f"{node}|{tier}|total_latency": float(latency),
+            },
+            values={f"{node}|{tier}|model": model},
+        )
+
+    def record_escalation(self, node: str):
+        """Record a node escalating from the small to the large model."""
+        _increment(self.key, {f"{node}|escalations": 1})
+
+    def snapshot(self) -> dict:
+        """
+        Return the current counters across all workers.
+
+        Returns:
+            Dictionary keyed by node, with per-tier calls, failure_rate and avg_latency
+        """
+        nodes = {}
+        for field, value in get_redis_client().hgetall(self.key).items():
+            parts = field.split("|")
+            node = nodes.setdefault(parts[0], {"escalations": 0, "tiers": {}})
+            if len(parts) == 2:
+                node["escalations"] = int(value)
+            else:
+                node["tiers"].setdefault(parts[1], {})[parts[2]] = value
+
+        result = {}
+        for name, data in nodes.items():
+            tiers = {}
+            for tier, stats in data["tiers"].items():
+                calls = int(stats.get("calls", 0))
+                failures = int(stats.get("failures", 0))
+                total_latency = float(stats.get("total_latency", 0.0))
+                tiers[tier] = {
+                    "model": stats.get("model"),
+                    "calls": calls,
+                    "failures": failures,
+                    "failure_rate": failures / calls if calls else None,
+                    "avg_latency": total_latency / calls if calls else None,
+                }
+            result[name] = {"escalations": data["escalations"], "tiers": tiers}
+        return result
+
+
+model_tier_metrics = ModelTierMetrics()
@@ -0,0 +1,106 @@
+"""
+Tiered Model Selection - Per-node model configuration with a cascade policy.
+
+Each workflow node has a small (fast, cheap) and a large model. Calls go to
+the small model first and escalate to the large model when the small model
+raises (e.g. schema-validation failure) or its output is rejected (low
+confidence, SQL that fails EXPLAIN, empty text). When both tiers point to
+the same model, the node calls it directly.
+
+Models are configured per node through environment variables:
+    <NODE>_SMALL_MODEL, <NODE>_LARGE_MODEL
+e.g. CLARIFY_WITH_USER_SMALL_MODEL=openai:gpt-4o-mini
+"""
+
+import os
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from langchain.chat_models import init_chat_model
+
+from sales_info_agent.workflow.metrics import model_tier_metrics
+
+
+DEFAULT_LARGE_MODEL = os.getenv("DEFAULT_LARGE_MODEL", "openai:gpt-4o")
+DEFAULT_SMALL_MODEL = os.getenv("DEFAULT_SMALL_MODEL", "openai:gpt-4o-mini")
+
+# (small, large) per node; SQL generation stays on the large model by default
+NODE_MODEL_DEFAULTS = {
+    "clarify_with_user": (DEFAULT_SMALL_MODEL, DEFAULT_LARGE_MODEL),
+    "write_sql_query": (DEFAULT_LARGE_MODEL, DEFAULT_LARGE_MODEL),
+    "format_response": (DEFAULT_SMALL_MODEL, DEFAULT_LARGE_MODEL),
+}
+
+CONFIDENCE_THRESHOLD = float(os.getenv("CASCADE_CONFIDENCE_THRESHOLD", "0.7"))
+
+
+def get_node_model_names(node: str) -> tuple[str, str]:
+    """
+    Resolve the (small, large) model names for a node.
+
+    Args:
+        node: Workflow node name
+
+    Returns:
+        Tuple of (small_model, large_model) identifiers for init_chat_model
+    """
+    small, large = NODE_MODEL_DEFAULTS.get(node, (DEFAULT_LARGE_MODEL, DEFAULT_LARGE_MODEL))
+    prefix = node.upper()
+    return (
+        os.getenv(f"{prefix}_SMALL_MODEL", small),
+        os.getenv(f"{prefix}_LARGE_MODEL", large),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_chat_model(model_name: str, temperature: float):
+    """Create (once) and return a chat model for the given name and temperature."""
+    return init_chat_model(model=model_name, temperature=temperature)
+
+
+def invoke_with_cascade(
+    node: str,
+    temperature: float,
+    call: Callable[[Any], Any],
+    accept: Optional[Callable[[Any], bool]] = None,
+) -> Any:
+    """
+    Invoke a node's model call with small → large escalation.
+
+    Args:
+        node: Workflow node name (selects models and metrics bucket)
+        temperature: Sampling temperature for both tiers
+        call: Function receiving a chat model and returning the node output
+        accept: Optional check on the small model output; False escalates
+
+    Returns:
+        Output of call from the first tier that succeeds
+    """
+    small_name, large_name = get_node_model_names(node)
+
+    if small_name != large_name:
+        start = perf_counter()
+        try:
+            result = call(get_chat_model(small_name, temperature))
+        except Exception as e:
+            model_tier_metrics.record_call(node, "small", small_name, perf_counter() - start, ok=False)
+            print(f"✗ {node}: small model failed ({e}), escalating to {large_name}")
+        else:
+            ok = accept is None or accept(result)
+            model_tier_metrics.record_call(node, "small", small_name, perf_counter() - start, ok=ok)
+            if ok:
+                return result
+            print(f"✗ {node}: small model output rejected, escalating to {large_name}")
+
+        model_tier_metrics.record_escalation(node)
+
+    start = perf_counter()
+    try:
+        result = call(get_chat_model(large_name, temperature))
+    except Exception:
+        model_tier_metrics.record_call(node, "large", large_name, perf_counter() - start, ok=False)
+        raise
+
+    model_tier_metrics.record_call(node, "large", large_name, perf_counter() - start, ok=True)
+    return result
@@ -0,0 +1,61 @@
+"""
+Redis Clients - Pooled Redis clients sized from the worker budget.
+
+All Redis connections of a worker come from this module: the text client
+(metrics, query telemetry), the binary client (audit records) and the
+client handed to the RedisSaver checkpointer. Each gets a third of the
+worker's share of REDIS_MAX_CONNECTIONS, so the deployment never holds more
+than that total.
+
+Clients are created on first use, so importing workflow nodes does not
+build any pool.
+"""
+
+import os
+from functools import lru_cache
+
+from redis import Redis, BlockingConnectionPool
+
+from sales_info_agent.workflow.worker_budget import worker_share
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+def _client_share() -> int:
+    """Connections per client: the worker's Redis budget split across the three clients."""
+    return max(1, worker_share("REDIS_MAX_CONNECTIONS", 64) // 3)
+
+
+def _create_pooled_client(decode_responses: bool) -> Redis:
+    """
+    Create a Redis client on a blocking pool.
+
+    Blocks instead of failing when the per-worker budget is in use;
+    redis-py resets the pool in each forked worker.
+    """
+    return Redis(
+        connection_pool=BlockingConnectionPool.from_url(
+            REDIS_URL,
+            decode_responses=decode_responses,
+            max_connections=_client_share(),
+            timeout=int(os.getenv("REDIS_POOL_TIMEOUT", "5")),
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def get_redis_client() -> Redis:
+    """Return the text client (decoded responses)."""
+    return _create_pooled_client(decode_responses=True)
+
+
+@lru_cache(maxsize=None)
+def get_redis_binary_client() -> Redis:
+    """Return the raw bytes client, for compressed audit records."""
+    return _create_pooled_client(decode_responses=False)
+
+
+@lru_cache(maxsize=None)
+def get_checkpointer_redis_client() -> Redis:
+    """Return the raw bytes client reserved for the RedisSaver checkpointer."""
+    return _create_pooled_client(decode_responses=False)
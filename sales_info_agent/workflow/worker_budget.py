@@ -0,0 +1,32 @@
+"""
+Worker Budget - Split global resource budgets across server worker processes.
+
+Pool sizes (Redis connections, MySQL connections, speculation threads) are
+configured as a total for the whole deployment. Each worker process takes
+its share, so adding workers does not multiply the load on Redis/MySQL.
+
+The worker count comes from WEB_CONCURRENCY, which gunicorn.conf.py sets
+before the app is preloaded and workers are forked.
+"""
+
+import os
+
+
+def get_worker_count() -> int:
+    """Return the number of server worker processes (1 when not under gunicorn)."""
+    return max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+
+
+def worker_share(env_name: str, default_total: int) -> int:
+    """
+    Compute this worker's share of a global budget.
+
+    Args:
+        env_name: Environment variable holding the deployment-wide total
+        default_total: Total used when the variable is not set
+
+    Returns:
+        Per-worker size, never less than 1
+    """
+    total = int(os.getenv(env_name, str(default_total)))
+    return max(1, total // get_worker_count())
@@ -1,12 +1,18 @@
 """
 Redis configuration for LangGraph checkpointer.
 Centralizes Redis connection for both checkpointer and custom operations.
+
+The pooled clients are built by sales_info_agent.workflow.redis_clients,
+which sizes them from the worker budget.
 """
 
-import os
 from redis import Redis
 
-REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+from sales_info_agent.workflow.redis_clients import (
+    REDIS_URL,
+    get_redis_binary_client,
+    get_redis_client,
+)
 
 def get_redis_connection():
     """
@@ -14,4 +20,7 @@ def get_redis_connection():
     """
     return Redis.from_url(REDIS_URL, decode_responses=False)
 
-redis_client = Redis.from_url(REDIS_URL, decode_responses=True)
\ No newline at end of file
+redis_client = get_redis_client()
+
+# Raw bytes, for compressed audit records
+redis_binary_client = get_redis_binary_client()
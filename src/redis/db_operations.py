@@ -1,13 +1,78 @@
 import json
-from src.redis.config import redis_client
+from src.redis.config import redis_client, redis_binary_client
+from src.redis.serialization import FORMAT_VERSION, encode_value, decode_value, compute_etag
+
+THREAD_KEY_PREFIX = "thread_audit:"
+
+
+def thread_key(thread_id: str) -> str:
+    """Chave do hash de auditoria da thread"""
+    return f"{THREAD_KEY_PREFIX}{thread_id}"
+
+
+def _is_legacy_record(thread_id: str) -> bool:
+    """Registro legado é uma string JSON na chave thread_id (outros tipos não são da auditoria)"""
+    return redis_client.type(thread_id) == "string"
+
 
 async def save_thread_interaction(thread_id: str, data: dict):
-    """Salvar interação no Redis"""
-    redis_client.set(thread_id, json.dumps(data))
-
-async def get_thread_interactions(thread_id: str):
-    """Buscar interação no Redis"""
-    data = redis_client.get(thread_id)
-    if data:
-        return json.loads(data)
-    return None
+    """Salvar interação no Redis (um campo comprimido por chave do registro)"""
+    encoded = {name: encode_value(value) for name, value in data.items()}
+    etag = compute_etag(encoded)
+
+    pipe = redis_binary_client.pipeline()
+    pipe.delete(thread_key(thread_id))
+    pipe.hset(thread_key(thread_id), mapping={
+        **encoded,
+        "_v": FORMAT_VERSION,
+        "_etag": etag,
+    })
+    # Remove o registro legado (JSON em string) da mesma thread; nunca apaga
+    # chaves de outro tipo com o mesmo nome (métricas, telemetria, checkpoints)
+    if _is_legacy_record(thread_id):
+        pipe.delete(thread_id)
+    pipe.execute()
+
+
+async def get_thread_etag(thread_id: str):
+    """Buscar apenas o ETag da interação (None se não existir ou for legado)"""
+    etag = redis_binary_client.hget(thread_key(thread_id), "_etag")
+    return etag.decode() if etag else None
+
+
+async def get_thread_interactions(thread_id: str, fields: list = None):
+    """
+    Buscar interação no Redis.
+
+    Com fields, só os campos pedidos são lidos e decodificados.
+    Retorna (dados, etag); etag é None para registros legados.
+    """
+    key = thread_key(thread_id)
+
+    if fields is None:
+        stored = redis_binary_client.hgetall(key)
+    else:
+        values = redis_binary_client.hmget(key, ["_etag", *fields])
+        stored = {b"_etag": values[0]}
+        stored.update({name.encode(): value for name, value in zip(fields, values[1:]) if value is not None})
+
+    if stored.get(b"_etag"):
+        data = {
+            name.decode(): decode_value(value)
+            for name, value in stored.items()
+            if not name.startswith(b"_")
+        }
+        return data, stored[b"_etag"].decode()
+
+    legacy = redis_client.get(thread_id) if _is_legacy_record(thread_id) else None
+    if legacy:
+        try:
+            data = json.loads(legacy)
+        except ValueError:
+            return None, None
+        if not isinstance(data, dict):
+            return None, None
+        if fields is not None:
+            data = {name: data[name] for name in fields if name in data}
+        return data, None
+    return None, None
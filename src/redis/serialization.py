@@ -0,0 +1,93 @@
+"""
+Versioned binary encoding for thread audit records stored in Redis.
+
+Each top-level field of a record is stored as its own hash field, encoded as:
+
+    FORMAT_VERSION (1 byte) | serializer (1 byte) | compressor (1 byte) | payload
+
+- serializer: b"m" msgpack, b"j" compact JSON
+- compressor: b"s" zstd, b"z" zlib, b"n" none (small values)
+
+msgpack and zstd are used when installed, with JSON and zlib as fallbacks.
+The header lets any worker decode records written with a different codec.
+"""
+
+import hashlib
+import json
+import zlib
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+FORMAT_VERSION = 2
+
+# Values smaller than this are stored uncompressed
+COMPRESSION_MIN_BYTES = 256
+
+
+def _serialize(value) -> tuple[bytes, bytes]:
+    if msgpack is not None:
+        return b"m", msgpack.packb(value, default=str, use_bin_type=True)
+    return b"j", json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode()
+
+
+def _deserialize(serializer: bytes, payload: bytes):
+    if serializer == b"m":
+        if msgpack is None:
+            raise ValueError("Record was written with msgpack, which is not installed")
+        return msgpack.unpackb(payload, raw=False)
+    if serializer == b"j":
+        return json.loads(payload)
+    raise ValueError(f"Unknown serializer: {serializer!r}")
+
+
+def _compress(payload: bytes) -> tuple[bytes, bytes]:
+    if len(payload) < COMPRESSION_MIN_BYTES:
+        return b"n", payload
+    if zstandard is not None:
+        return b"s", zstandard.ZstdCompressor(level=3).compress(payload)
+    return b"z", zlib.compress(payload, 6)
+
+
+def _decompress(compressor: bytes, payload: bytes) -> bytes:
+    if compressor == b"n":
+        return payload
+    if compressor == b"s":
+        if zstandard is None:
+            raise ValueError("Record was written with zstd, which is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    if compressor == b"z":
+        return zlib.decompress(payload)
+    raise ValueError(f"Unknown compressor: {compressor!r}")
+
+
+def encode_value(value) -> bytes:
+    """Encode one field value into the versioned binary format."""
+    serializer, payload = _serialize(value)
+    compressor, payload = _compress(payload)
+    return bytes([FORMAT_VERSION]) + serializer + compressor + payload
+
+
+def decode_value(blob: bytes):
+    """Decode one field value written by encode_value."""
+    version = blob[0]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported record format version: {version}")
+    serializer, compressor = blob[1:2], blob[2:3]
+    return _deserialize(serializer, _decompress(compressor, blob[3:]))
+
+
+def compute_etag(encoded_fields: dict) -> str:
+    """Compute a stable ETag from encoded field blobs."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(encoded_fields):
+        digest.update(name.encode())
+        digest.update(encoded_fields[name])
+    return digest.hexdigest()
@@ -2,14 +2,59 @@ from src.sales_agent_api.service.service import (
     run_sales_info_search_service,
     get_thread_service,
     generate_thread_id_service,
+    get_speculation_metrics_service,
+    get_model_tier_metrics_service,
+    get_slow_queries_service,
 )
-from typing import Any
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse, Response
+from typing import Any, Optional
+
+THREAD_FIELDS = ("messages", "sql_query", "product_filters", "timestamp")
+
+def parse_if_none_match(header: Optional[str]) -> set:
+    """Parse an If-None-Match header into bare ETag values."""
+    if not header:
+        return set()
+    return {tag.strip().removeprefix("W/").strip('"') for tag in header.split(",")}
 
 async def sales_info_search_controller(agent, request: Any):
     return await run_sales_info_search_service(agent, request.message, request.thread_id)
 
-async def get_thread_controller(thread_id: str):
-    return await get_thread_service(thread_id)
+async def get_thread_controller(
+    thread_id: str,
+    fields: Optional[str] = None,
+    last_turns: Optional[int] = None,
+    if_none_match: Optional[str] = None,
+):
+    field_list = None
+    if fields:
+        field_list = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in field_list if name not in THREAD_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(THREAD_FIELDS)}",
+            )
+
+    data, etag = await get_thread_service(
+        thread_id, field_list, last_turns, parse_if_none_match(if_none_match)
+    )
+    # Weak: the tag versions the stored record, while fields/last_turns change the body
+    headers = {"ETag": f'W/"{etag}"'} if etag else {}
+
+    if data is None:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=data, headers=headers)
 
 async def generate_thread_id_controller():
-    return await generate_thread_id_service()
\ No newline at end of file
+    return await generate_thread_id_service()
+
+async def get_speculation_metrics_controller():
+    return await get_speculation_metrics_service()
+
+async def get_model_tier_metrics_controller():
+    return await get_model_tier_metrics_service()
+
+async def get_slow_queries_controller(limit: int, min_avg_ms: float, window: int):
+    return await get_slow_queries_service(limit, min_avg_ms, window)
\ No newline at end of file
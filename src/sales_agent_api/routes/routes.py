@@ -1,8 +1,12 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Header, Query
+from typing import Optional
 from src.sales_agent_api.controller.controller import (
     sales_info_search_controller,
     get_thread_controller,
     generate_thread_id_controller,
+    get_speculation_metrics_controller,
+    get_model_tier_metrics_controller,
+    get_slow_queries_controller,
 )
 from src.sales_agent_api.models.models import SalesInfoSearchRequest
 from src.app import app
@@ -31,9 +35,30 @@ async def sales_info_search_endpoint(request: SalesInfoSearchRequest):
     return await sales_info_search_controller(app.agent, request)
 
 @router.get("/threads/{thread_id}", tags=["Thread"])
-async def get_thread(thread_id: str):
-    return await get_thread_controller(thread_id)
+async def get_thread(
+    thread_id: str,
+    fields: Optional[str] = Query(None, description="Comma-separated: messages, sql_query, product_filters, timestamp"),
+    last_turns: Optional[int] = Query(None, ge=1, description="Only the last N conversation turns"),
+    if_none_match: Optional[str] = Header(None),
+):
+    return await get_thread_controller(thread_id, fields, last_turns, if_none_match)
 
 @router.get("/threads", tags=["Thread"])
 async def generate_thread():
-    return await generate_thread_id_controller()
\ No newline at end of file
+    return await generate_thread_id_controller()
+
+@router.get("/diagnostics/speculation", tags=["Diagnostics"])
+async def get_speculation_metrics():
+    return await get_speculation_metrics_controller()
+
+@router.get("/diagnostics/models", tags=["Diagnostics"])
+async def get_model_tier_metrics():
+    return await get_model_tier_metrics_controller()
+
+@router.get("/diagnostics/slow-queries", tags=["Diagnostics"])
+async def get_slow_queries(
+    limit: int = Query(20, ge=1, le=200),
+    min_avg_ms: float = Query(0.0, ge=0),
+    window: int = Query(5000, ge=1, description="Number of most recent statements to aggregate"),
+):
+    return await get_slow_queries_controller(limit, min_avg_ms, window)
\ No newline at end of file
@@ -6,8 +6,15 @@ Redis customizado usado apenas para auditoria/histórico externo.
 
 import uuid
 from datetime import datetime
+from fastapi.concurrency import run_in_threadpool
 from sales_info_agent.main import run_sales_info_search_workflow
-from src.redis.db_operations import save_thread_interaction, get_thread_interactions
+from sales_info_agent.execution_step.core.database.query_telemetry import get_slow_queries
+from sales_info_agent.workflow.metrics import speculation_metrics, model_tier_metrics
+from src.redis.db_operations import (
+    save_thread_interaction,
+    get_thread_interactions,
+    get_thread_etag,
+)
 
 
 async def run_sales_info_search_service(agent, message: str, thread_id: str = None):
@@ -41,14 +48,47 @@ async def run_sales_info_search_service(agent, message: str, thread_id: str = No
     return response
 
 
-async def get_thread_service(thread_id: str):
+def select_last_turns(messages: list, last_turns: int) -> list:
+    """
+    Keep only the last N turns, a turn starting at each human message.
+    """
+    human_indexes = [i for i, msg in enumerate(messages) if msg.get("type") == "HumanMessage"]
+    if len(human_indexes) <= last_turns:
+        return messages
+    return messages[human_indexes[-last_turns]:]
+
+
+async def get_thread_service(
+    thread_id: str,
+    fields: list = None,
+    last_turns: int = None,
+    if_none_match: set = None,
+):
     """
     Retrieve thread history from custom Redis storage (audit trail).
+
+    Args:
+        thread_id: Thread identifier
+        fields: Record fields to return (None returns all)
+        last_turns: Keep only the last N conversation turns in messages
+        if_none_match: ETags the client already has
+
+    Returns:
+        Tuple of (data, etag); data is None when the client's ETag is current
     """
-    data = await get_thread_interactions(thread_id)
+    if if_none_match:
+        etag = await get_thread_etag(thread_id)
+        if etag and (etag in if_none_match or "*" in if_none_match):
+            return None, etag
+
+    data, etag = await get_thread_interactions(thread_id, fields)
     if not data:
-        return {"thread_id": thread_id, "status": "not found"}
-    return data
+        return {"thread_id": thread_id, "status": "not found"}, None
+
+    data["thread_id"] = thread_id
+    if last_turns and data.get("messages"):
+        data["messages"] = select_last_turns(data["messages"], last_turns)
+    return data, etag
 
 
 async def generate_thread_id_service():
@@ -56,4 +96,31 @@ async def generate_thread_id_service():
     Generate a new unique thread ID.
     """
     thread_id = str(uuid.uuid4())
-    return {"thread_id": thread_id}
\ No newline at end of file
+    return {"thread_id": thread_id}
+
+
+async def get_speculation_metrics_service():
+    """
+    Return speculative scoping counters (hit rate and wasted tokens).
+    """
+    return speculation_metrics.snapshot()
+
+
+async def get_model_tier_metrics_service():
+    """
+    Return per-node model cascade counters (calls, failures, latency, escalations).
+    """
+    return model_tier_metrics.snapshot()
+
+
+async def get_slow_queries_service(limit: int = 20, min_avg_ms: float = 0.0, window: int = 5000):
+    """
+    Aggregate recently executed SQL by fingerprint, slowest first, with index suggestions.
+
+    Runs in the threadpool: it reads up to `window` records from Redis and
+    EXPLAINs sample statements against MySQL.
+    """
+    queries = await run_in_threadpool(
+        get_slow_queries, limit=limit, min_avg_ms=min_avg_ms, window=window
+    )
+    return {"window": window, "queries": queries}
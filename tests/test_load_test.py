@@ -0,0 +1,52 @@
+from benchmarks.load_test import check_regression, config_mismatches, redis_db, summarize
+
+
+CONFIG = {"conversations": 3, "concurrency": 8, "duration": 30.0, "workers": 1, "checkpointer": "memory"}
+
+
+def result(p95=1.0, rps=10.0, error_rate=0.0, **config):
+    return {"p95": p95, "rps": rps, "error_rate": error_rate, "config": {**CONFIG, **config}}
+
+
+def test_no_regression_within_threshold():
+    assert check_regression(result(p95=1.09, rps=9.1), result(), 0.10) == []
+
+
+def test_p95_and_rps_regressions_are_reported():
+    regressions = check_regression(result(p95=1.2, rps=8.0), result(), 0.10)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("p95 1.200s")
+    assert regressions[1].startswith("rps 8.0")
+
+
+def test_any_error_rate_increase_is_a_regression():
+    regressions = check_regression(result(error_rate=0.01), result(), 0.10)
+
+    assert regressions == ["error rate 1.00% > baseline 0.00%"]
+
+
+def test_run_without_successful_requests_is_a_regression():
+    failed = summarize([], ["URLError: refused"], 30.0)
+
+    assert check_regression(failed, result(), 0.10) == ["no successful requests"]
+
+
+def test_matching_settings_have_no_mismatches():
+    assert config_mismatches(result(), result(p95=2.0)) == []
+
+
+def test_changed_and_missing_settings_are_mismatches():
+    baseline = result(workers=2)
+    del baseline["config"]["checkpointer"]
+
+    assert config_mismatches(result(), baseline) == [
+        "workers: 2 -> 1",
+        "checkpointer: None -> 'memory'",
+    ]
+
+
+def test_redis_db_defaults_to_zero():
+    assert redis_db("redis://localhost:6379/15") == 15
+    assert redis_db("redis://localhost:6380") == 0
+    assert redis_db("redis://localhost:6380/") == 0
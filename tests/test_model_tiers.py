@@ -0,0 +1,98 @@
+import pytest
+
+pytest.importorskip("langchain")
+pytest.importorskip("redis")
+
+from sales_info_agent.workflow import model_tiers
+from sales_info_agent.workflow.model_tiers import invoke_with_cascade
+
+
+class FakeModel:
+    def __init__(self, name, temperature):
+        self.name = name
+        self.temperature = temperature
+
+
+class FakeMetrics:
+    def __init__(self):
+        self.calls = []
+        self.escalations = []
+
+    def record_call(self, node, tier, model, latency, ok):
+        self.calls.append((node, tier, model, ok))
+
+    def record_escalation(self, node):
+        self.escalations.append(node)
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    fake = FakeMetrics()
+    monkeypatch.setattr(model_tiers, "model_tier_metrics", fake)
+    monkeypatch.setattr(model_tiers, "get_chat_model", FakeModel)
+    monkeypatch.setenv("TEST_NODE_SMALL_MODEL", "small-model")
+    monkeypatch.setenv("TEST_NODE_LARGE_MODEL", "large-model")
+    return fake
+
+
+def test_small_model_output_is_returned_when_accepted(metrics):
+    result = invoke_with_cascade("test_node", 0.0, call=lambda model: model.name, accept=lambda r: True)
+
+    assert result == "small-model"
+    assert metrics.calls == [("test_node", "small", "small-model", True)]
+    assert metrics.escalations == []
+
+
+def test_small_model_exception_escalates_to_large(metrics):
+    def call(model):
+        if model.name == "small-model":
+            raise ValueError("invalid schema")
+        return model.name
+
+    assert invoke_with_cascade("test_node", 0.0, call=call) == "large-model"
+    assert metrics.calls == [
+        ("test_node", "small", "small-model", False),
+        ("test_node", "large", "large-model", True),
+    ]
+    assert metrics.escalations == ["test_node"]
+
+
+def test_rejected_small_output_escalates_to_large(metrics):
+    result = invoke_with_cascade(
+        "test_node", 0.3, call=lambda model: model.name, accept=lambda r: r != "small-model"
+    )
+
+    assert result == "large-model"
+    assert metrics.calls == [
+        ("test_node", "small", "small-model", False),
+        ("test_node", "large", "large-model", True),
+    ]
+    assert metrics.escalations == ["test_node"]
+
+
+def test_same_small_and_large_model_is_called_once(metrics, monkeypatch):
+    monkeypatch.setenv("TEST_NODE_SMALL_MODEL", "large-model")
+    models = []
+
+    def call(model):
+        models.append(model)
+        return model.name
+
+    assert invoke_with_cascade("test_node", 0.0, call=call, accept=lambda r: False) == "large-model"
+    assert [m.name for m in models] == ["large-model"]
+    assert metrics.calls == [("test_node", "large", "large-model", True)]
+    assert metrics.escalations == []
+
+
+def test_large_model_failure_is_recorded_and_raised(metrics):
+    def call(model):
+        raise RuntimeError(model.name)
+
+    with pytest.raises(RuntimeError, match="large-model"):
+        invoke_with_cascade("test_node", 0.0, call=call)
+
+    assert metrics.calls == [
+        ("test_node", "small", "small-model", False),
+        ("test_node", "large", "large-model", False),
+    ]
+    assert metrics.escalations == ["test_node"]
@@ -0,0 +1,69 @@
+import zlib
+
+import pytest
+
+from src.redis import serialization
+from src.redis.serialization import (
+    FORMAT_VERSION,
+    compute_etag,
+    decode_value,
+    encode_value,
+)
+
+
+RECORD_VALUES = [
+    "SELECT 1",
+    None,
+    42,
+    {"query_type": "list", "cooler_criteria": None},
+    [{"type": "HumanMessage", "content": "Quantos coolers estão em serviço? " * 50}],
+]
+
+
+@pytest.mark.parametrize("value", RECORD_VALUES)
+def test_round_trip(value):
+    assert decode_value(encode_value(value)) == value
+
+
+def test_header_has_version_and_codecs():
+    blob = encode_value("x" * 1000)
+
+    assert blob[0] == FORMAT_VERSION
+    assert blob[1:2] in (b"m", b"j")
+    assert blob[2:3] in (b"s", b"z")
+
+
+def test_small_values_are_not_compressed():
+    assert encode_value("SELECT 1")[2:3] == b"n"
+
+
+def test_json_zlib_fallback_round_trip(monkeypatch):
+    monkeypatch.setattr(serialization, "msgpack", None)
+    monkeypatch.setattr(serialization, "zstandard", None)
+    value = {"messages": ["a" * 500]}
+
+    blob = encode_value(value)
+
+    assert blob[1:3] == b"jz"
+    assert decode_value(blob) == value
+
+
+def test_rejects_unknown_version():
+    blob = bytes([FORMAT_VERSION + 1]) + b"jn" + b'"x"'
+
+    with pytest.raises(ValueError):
+        decode_value(blob)
+
+
+def test_rejects_unknown_codec():
+    blob = bytes([FORMAT_VERSION]) + b"jq" + zlib.compress(b'"x"')
+
+    with pytest.raises(ValueError):
+        decode_value(blob)
+
+
+def test_etag_is_stable_and_content_sensitive():
+    fields = {"sql_query": encode_value("SELECT 1"), "timestamp": encode_value("t1")}
+
+    assert compute_etag(fields) == compute_etag(dict(reversed(list(fields.items()))))
+    assert compute_etag(fields) != compute_etag({**fields, "timestamp": encode_value("t2")})
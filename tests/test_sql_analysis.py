@@ -0,0 +1,62 @@
+from sales_info_agent.execution_step.core.database.sql_analysis import (
+    fingerprint,
+    normalize_query,
+    suggest_indexes,
+)
+
+
+def test_normalize_replaces_literals_and_collapses_in_lists():
+    sql = "SELECT *  FROM coolers\nWHERE status = 'in service' AND region IN (1, 2,3) LIMIT 10;"
+
+    assert normalize_query(sql) == "select * from coolers where status = ? and region in (?+) limit ?"
+
+
+def test_queries_differing_only_in_literals_share_a_fingerprint():
+    first = normalize_query("SELECT * FROM coolers WHERE coolerId = 1010001")
+    second = normalize_query("select * from coolers where coolerId = 42")
+
+    assert fingerprint(first) == fingerprint(second)
+    assert fingerprint(first) != fingerprint(normalize_query("SELECT * FROM coolers WHERE status = 1"))
+
+
+def test_equality_columns_before_one_range_column():
+    sql = "SELECT * FROM coolers WHERE status = 'x' AND moved_at >= '2024-01-01' AND created_at < '2025-01-01' AND region IN (1, 2)"
+
+    assert suggest_indexes(sql) == ["CREATE INDEX idx_coolers_status_region_moved_at ON coolers (status, region, moved_at);"]
+
+
+def test_aliases_map_columns_to_their_tables():
+    sql = (
+        "SELECT c.* FROM coolers c JOIN moves AS m ON m.cooler_id = c.id "
+        "WHERE c.status = 1 AND m.moved_at >= 2 ORDER BY c.id"
+    )
+
+    assert suggest_indexes(sql) == [
+        "CREATE INDEX idx_coolers_status ON coolers (status);",
+        "CREATE INDEX idx_moves_moved_at ON moves (moved_at);",
+    ]
+
+
+def test_top_level_or_gets_separate_indexes():
+    sql = "SELECT * FROM coolers WHERE a = 1 OR b = 2"
+
+    assert suggest_indexes(sql) == [
+        "CREATE INDEX idx_coolers_a ON coolers (a);",
+        "CREATE INDEX idx_coolers_b ON coolers (b);",
+    ]
+
+
+def test_parenthesized_or_is_skipped():
+    sql = "SELECT * FROM coolers WHERE (a = 1 OR b = 2) AND c = 3"
+
+    assert suggest_indexes(sql) == ["CREATE INDEX idx_coolers_c ON coolers (c);"]
+
+
+def test_or_inside_string_literal_is_not_a_branch():
+    sql = "SELECT * FROM coolers WHERE status = 'in or out' AND region = 3"
+
+    assert suggest_indexes(sql) == ["CREATE INDEX idx_coolers_status_region ON coolers (status, region);"]
+
+
+def test_no_where_clause_no_suggestion():
+    assert suggest_indexes("SELECT COUNT(*) FROM coolers") == []
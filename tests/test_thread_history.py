@@ -0,0 +1,53 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("langchain")
+pytest.importorskip("redis")
+
+from src.sales_agent_api.controller.controller import parse_if_none_match
+from src.sales_agent_api.service.service import select_last_turns
+
+
+def human(content):
+    return {"type": "HumanMessage", "content": content}
+
+
+def ai(content):
+    return {"type": "AIMessage", "content": content}
+
+
+CONVERSATION = [
+    human("Quero ver um cooler"),
+    ai("Qual cooler?"),
+    human("O cooler 1010001"),
+    ai("Está em serviço."),
+    human("E quando foi movido?"),
+    ai("Em março."),
+]
+
+
+def test_last_turns_start_at_a_human_message():
+    assert select_last_turns(CONVERSATION, 2) == CONVERSATION[2:]
+    assert select_last_turns(CONVERSATION, 1) == CONVERSATION[4:]
+
+
+def test_last_turns_keeps_everything_when_there_are_fewer_turns():
+    assert select_last_turns(CONVERSATION, 3) == CONVERSATION
+    assert select_last_turns(CONVERSATION, 10) == CONVERSATION
+
+
+def test_last_turns_keeps_leading_messages_without_human_turns():
+    messages = [ai("Olá!")]
+
+    assert select_last_turns(messages, 1) == messages
+
+
+@pytest.mark.parametrize("header", [None, ""])
+def test_missing_if_none_match_is_empty(header):
+    assert parse_if_none_match(header) == set()
+
+
+def test_if_none_match_accepts_weak_strong_and_lists():
+    assert parse_if_none_match('W/"abc"') == {"abc"}
+    assert parse_if_none_match('"abc"') == {"abc"}
+    assert parse_if_none_match('W/"abc", "def" ,W/"ghi"') == {"abc", "def", "ghi"}